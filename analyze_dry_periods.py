@@ -5,18 +5,113 @@ A period with no rain is defined as consecutive days between recorded rainfall e
 """
 
 import argparse
-import json
-from datetime import datetime, timedelta
-from typing import List, Tuple
+import bisect
+import heapq
+import re
+import sys
+from datetime import date
+from operator import attrgetter, itemgetter
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; fall back to the standard library
+    from json import loads as _json_loads
+
+try:
+    import ijson
+except ImportError:  # ijson is optional; without it the file is loaded whole
+    ijson = None
+
+
+class DryPeriod(NamedTuple):
+    """A run of consecutive days without rain, stored as date ordinals."""
+    start_ord: int
+    end_ord: int
+    days: int
+    
+    # Formatted on access so only the periods that get printed pay for it
+    @property
+    def start_date(self) -> str:
+        return date.fromordinal(self.start_ord).isoformat()
+    
+    @property
+    def end_date(self) -> str:
+        return date.fromordinal(self.end_ord).isoformat()
+
+
+# Fetches both fields of a rainfall entry in a single C-level call
+_rain_and_date = itemgetter('rainfall_mm', 'date')
+
+# Formats one row of a dry period table
+_format_row = "{:<6} {:<12} {:<12} {:<6}".format
+
+# Matches a YYYY-MM-DD string made only of ASCII digits and dashes
+_iso_date_match = re.compile(r'\d{4}-\d{2}-\d{2}', re.ASCII).fullmatch
+
+
+def _parse_iso(date_str: str) -> date:
+    """Parse a YYYY-MM-DD string by slicing its fixed-width fields."""
+    # int() also accepts signs, spaces, underscores and non-ASCII digits, so
+    # check the whole layout before slicing
+    if not _iso_date_match(date_str):
+        raise ValueError(f"Invalid date {date_str!r}, expected YYYY-MM-DD")
+    return date(int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]))
 
 
 def load_rainfall_data(filename: str) -> dict:
     """Load rainfall data from JSON file."""
-    with open(filename, 'r') as f:
-        return json.load(f)
+    # Read raw bytes: orjson requires them and json.loads accepts them too
+    with open(filename, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def iter_rain_dates(data: dict, min_rainfall: float = 0.0) -> Iterator[str]:
+    """Yield the date strings of entries with rainfall >= min_rainfall."""
+    return (
+        date_str
+        for entries in data.values() if entries  # Skip empty years
+        for rainfall_mm, date_str in map(_rain_and_date, entries)
+        if rainfall_mm >= min_rainfall
+    )
 
 
-def find_dry_periods(data: dict, include_to_today: bool = True, min_rainfall: float = 0.0) -> List[Tuple[str, str, int]]:
+def stream_rain_dates(filename: str, min_rainfall: float = 0.0) -> Iterator[str]:
+    """
+    Yield rain day date strings straight from the JSON file.
+    
+    Uses ijson to read one year at a time when it is installed, otherwise
+    loads the whole file with load_rainfall_data.
+    """
+    if ijson is None:
+        yield from iter_rain_dates(load_rainfall_data(filename), min_rainfall)
+        return
+    
+    with open(filename, 'rb') as f:
+        for year, entries in ijson.kvitems(f, ''):
+            yield from iter_rain_dates({year: entries}, min_rainfall)
+
+
+def _scan_gaps(rain_ords: List[int]) -> List[Tuple[int, int, int]]:
+    """
+    Find the gaps between consecutive rain days.
+    
+    Args:
+        rain_ords: Sorted rain days as date ordinals
+    
+    Returns:
+        List of tuples: (start_ord, end_ord, days_count), where the dry period
+        runs from the day after one rain day to the day before the next
+    """
+    return [
+        (current_ord + 1, next_ord - 1, next_ord - current_ord - 1)
+        for current_ord, next_ord in zip(rain_ords, rain_ords[1:])
+        if next_ord - current_ord > 1
+    ]
+
+
+def find_dry_periods(data: dict, include_to_today: bool = True, min_rainfall: float = 0.0,
+                     today: Optional[date] = None) -> Tuple[List[DryPeriod], List[int]]:
     """
     Find all periods with no rain (gaps between rainfall events).
     
@@ -24,64 +119,68 @@ def find_dry_periods(data: dict, include_to_today: bool = True, min_rainfall: fl
         data: Rainfall data dictionary
         include_to_today: If True, include period from last rain to today
         min_rainfall: Minimum rainfall in mm to count as a rain day (default: 0.0)
+        today: Date that the final dry period runs up to (default: date.today())
     
     Returns:
-        List of tuples: (start_date, end_date, days_count)
+        Same as find_dry_periods_in_dates
     """
-    # Collect all dates with rainfall and sort them
-    all_dates = []
+    return find_dry_periods_in_dates(iter_rain_dates(data, min_rainfall),
+                                     include_to_today=include_to_today, today=today)
+
+
+def find_dry_periods_in_dates(date_strs: Iterable[str], include_to_today: bool = True,
+                              today: Optional[date] = None) -> Tuple[List[DryPeriod], List[int]]:
+    """
+    Find all periods with no rain between the given rain days.
     
-    for year, entries in data.items():
-        if not entries:  # Skip empty years
-            continue
-        for entry in entries:
-            # Only include dates with rainfall >= min_rainfall
-            if entry['rainfall_mm'] >= min_rainfall:
-                date_str = entry['date']
-                all_dates.append(datetime.strptime(date_str, '%Y-%m-%d'))
+    Args:
+        date_strs: Rain day date strings, already filtered by rainfall
+            (e.g. from iter_rain_dates or stream_rain_dates)
+        include_to_today: If True, include period from last rain to today
+        today: Date that the final dry period runs up to (default: date.today())
     
-    # Sort dates chronologically
-    all_dates.sort()
+    Returns:
+        Tuple of (dry_periods, rain_ords) where rain_ords is the sorted list
+        of distinct rain days as date ordinals and dry_periods is a list of
+        DryPeriod records. The periods are guaranteed to be in chronological
+        order and never to overlap, which main() relies on to binary search
+        them
+    """
+    # A day with several rainfall entries is still a single rain day.
+    # dict.fromkeys skips parsing repeated strings, and the set of parsed
+    # ordinals merges any remaining duplicates of the same day. Each date is
+    # kept as its day ordinal so the gap arithmetic is on plain ints, and the
+    # ordinals are sorted rather than the strings so the order never depends
+    # on spelling
+    rain_ords = sorted({_parse_iso(date_str).toordinal() for date_str in dict.fromkeys(date_strs)})
     
     # Find gaps between consecutive rainfall events
-    dry_periods = []
-    
-    for i in range(len(all_dates) - 1):
-        current_date = all_dates[i]
-        next_date = all_dates[i + 1]
-        
-        # Calculate the gap (days between rain events, excluding the rain days themselves)
-        gap_days = (next_date - current_date).days - 1
-        
-        if gap_days > 0:
-            # Start date is the day after current rain
-            start_date = current_date + timedelta(days=1)
-            # End date is the day before next rain
-            end_date = next_date - timedelta(days=1)
-            
-            dry_periods.append((
-                start_date.strftime('%Y-%m-%d'),
-                end_date.strftime('%Y-%m-%d'),
-                gap_days
-            ))
+    dry_periods = [DryPeriod(*gap) for gap in _scan_gaps(rain_ords)]
     
     # Add period from last rainfall to today
-    if include_to_today and all_dates:
-        last_rain = all_dates[-1]
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    if include_to_today and rain_ords:
+        last_rain_ord = rain_ords[-1]
+        if today is None:
+            today = date.today()
+        today_ord = today.toordinal()
         
         # Only add if today is after the last rain
-        if today > last_rain:
-            gap_days = (today - last_rain).days - 1
+        if today_ord > last_rain_ord:
+            gap_days = today_ord - last_rain_ord - 1
             if gap_days > 0:
-                start_date = last_rain + timedelta(days=1)
-                dry_periods.append((
-                    start_date.strftime('%Y-%m-%d'),
-                    today.strftime('%Y-%m-%d'),
-                    gap_days
-                ))
+                dry_periods.append(DryPeriod(last_rain_ord + 1, today_ord, gap_days))
     
-    return dry_periods
+    return dry_periods, rain_ords
+
+
+def _write_dry_period_rows(periods: Iterable[DryPeriod]) -> None:
+    """Write ranked table rows for the given periods in a single call."""
+    rows = [
+        _format_row(rank, period.start_date, period.end_date, period.days)
+        for rank, period in enumerate(periods, 1)
+    ]
+    if rows:
+        sys.stdout.write("\n".join(rows) + "\n")
 
 
 def main():
@@ -102,70 +201,63 @@ def main():
     min_rainfall = 2.0 if args.mode == 'l' else 0.0
     mode_description = "all rain days" if args.mode == 'a' else "days with >= 2mm rainfall"
     
-    # Load the data
-    data = load_rainfall_data('rainfall_data.json')
+    # Look up today's date once and use it for every calculation below
+    today = date.today()
+    
+    # Stream the rain days from the data file
+    rain_dates = stream_rain_dates('rainfall_data.json', min_rainfall)
     
     # Find all dry periods
-    dry_periods = find_dry_periods(data, min_rainfall=min_rainfall)
+    dry_periods, rain_ords = find_dry_periods_in_dates(rain_dates, today=today)
     
-    # Sort by duration (descending)
-    dry_periods.sort(key=lambda x: x[2], reverse=True)
+    # Select the longest periods without sorting every gap; nlargest keeps
+    # the same order as a stable descending sort
+    top_dry_periods = heapq.nlargest(25, dry_periods, key=attrgetter('days'))
     
     # Display top 25
     print(f"Top 25 Longest Periods with No Rain (Mode: {mode_description})")
     print("=" * 70)
-    print(f"{'Rank':<6} {'Start Date':<12} {'End Date':<12} {'Days':<6}")
+    print(_format_row('Rank', 'Start Date', 'End Date', 'Days'))
     print("-" * 70)
     
-    for rank, (start_date, end_date, days) in enumerate(dry_periods[:25], 1):
-        print(f"{rank:<6} {start_date:<12} {end_date:<12} {days:<6}")
+    _write_dry_period_rows(top_dry_periods)
     
     print("-" * 70)
     
     # Filter dry periods for the past year (from today's date)
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    past_year_start = today - timedelta(days=365)
-    past_year_end = today
-    
-    past_year_dry_periods = []
-    for start_date, end_date, days in dry_periods:
-        start = datetime.strptime(start_date, '%Y-%m-%d')
-        end = datetime.strptime(end_date, '%Y-%m-%d')
-        # Include if the dry period overlaps with the past year
-        if start <= past_year_end and end >= past_year_start:
-            past_year_dry_periods.append((start_date, end_date, days))
+    past_year_end_ord = today.toordinal()
+    past_year_start_ord = past_year_end_ord - 365
+    
+    # Dry periods are chronological and never overlap, so the ones that overlap
+    # with the past year form a contiguous slice that can be found by binary
+    # search. One-element tuples sort before any period starting on that day.
+    first = bisect.bisect_left(dry_periods, (past_year_start_ord,))
+    if first > 0 and dry_periods[first - 1].end_ord >= past_year_start_ord:
+        first -= 1  # The window starts part way through this period
+    last = bisect.bisect_left(dry_periods, (past_year_end_ord + 1,), lo=first)
+    past_year_dry_periods = dry_periods[first:last]
+    top_past_year_dry_periods = heapq.nlargest(10, past_year_dry_periods, key=attrgetter('days'))
     
     # Display top 10 for past year
-    print(f"\n\nTop 10 Longest Dry Periods for the Past Year ({past_year_start.strftime('%Y-%m-%d')} to {past_year_end.strftime('%Y-%m-%d')})")
+    print(f"\n\nTop 10 Longest Dry Periods for the Past Year ({date.fromordinal(past_year_start_ord).isoformat()} to {today.isoformat()})")
     print("=" * 70)
-    print(f"{'Rank':<6} {'Start Date':<12} {'End Date':<12} {'Days':<6}")
+    print(_format_row('Rank', 'Start Date', 'End Date', 'Days'))
     print("-" * 70)
     
-    for rank, (start_date, end_date, days) in enumerate(past_year_dry_periods[:10], 1):
-        print(f"{rank:<6} {start_date:<12} {end_date:<12} {days:<6}")
+    _write_dry_period_rows(top_past_year_dry_periods)
     
     print("-" * 70)
     
-    # Calculate additional statistics
-    all_dates = []
-    for year, entries in data.items():
-        if entries:
-            for entry in entries:
-                # Count rain days based on the same minimum rainfall threshold
-                if entry['rainfall_mm'] >= min_rainfall:
-                    all_dates.append(datetime.strptime(entry['date'], '%Y-%m-%d'))
-    
-    if all_dates:
-        all_dates.sort()
-        first_date = all_dates[0]
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        total_days = (today - first_date).days + 1
-        total_rain_days = len(all_dates)
+    # Calculate additional statistics from the rain days already collected
+    # with the same minimum rainfall threshold
+    if rain_ords:
+        total_days = today.toordinal() - rain_ords[0] + 1
+        total_rain_days = len(rain_ords)
         
         print(f"\nTotal days: {total_days}")
         print(f"Total days with rain: {total_rain_days}")
         if len(dry_periods) > 0:
-            total_dry_days = sum(period[2] for period in dry_periods)
+            total_dry_days = sum(period.days for period in dry_periods)
             print(f"Total days without rain: {total_dry_days}")
         print(f"Total dry periods found: {len(dry_periods)}")
         
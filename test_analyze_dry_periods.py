@@ -0,0 +1,74 @@
+import unittest
+from datetime import date
+
+from analyze_dry_periods import _parse_iso, find_dry_periods, find_dry_periods_in_dates
+
+
+class ParseIsoTest(unittest.TestCase):
+    def test_parses_valid_date(self):
+        self.assertEqual(_parse_iso('2024-01-05'), date(2024, 1, 5))
+
+    def test_rejects_wrong_separator(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('2024/01/05')
+
+    def test_rejects_wrong_length(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('2024-1-05')
+
+    def test_rejects_sign(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('2024-01-+5')
+
+    def test_rejects_underscore(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('2_24-01-05')
+
+    def test_rejects_space(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('2024-01- 5')
+
+    def test_rejects_non_ascii_digits(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('２０２４-01-05')
+
+    def test_rejects_impossible_date(self):
+        with self.assertRaises(ValueError):
+            _parse_iso('2024-02-30')
+
+
+class FindDryPeriodsTest(unittest.TestCase):
+    def test_applies_min_rainfall_to_data(self):
+        data = {
+            '2024': [
+                {'date': '2024-01-05', 'rainfall_mm': 3.0},
+                {'date': '2024-01-10', 'rainfall_mm': 0.5},
+                {'date': '2024-01-20', 'rainfall_mm': 2.0},
+            ],
+            '2025': [],
+        }
+        dry_periods, rain_ords = find_dry_periods(data, include_to_today=False, min_rainfall=2.0)
+        self.assertEqual([(p.start_date, p.end_date, p.days) for p in dry_periods],
+                         [('2024-01-06', '2024-01-19', 14)])
+
+
+class FindDryPeriodsInDatesTest(unittest.TestCase):
+    def test_sorts_rain_days_chronologically(self):
+        dry_periods, rain_ords = find_dry_periods_in_dates(
+            ['2024-01-20', '2024-01-05', '2024-01-10'], include_to_today=False)
+        self.assertEqual(rain_ords, [date(2024, 1, 5).toordinal(),
+                                     date(2024, 1, 10).toordinal(),
+                                     date(2024, 1, 20).toordinal()])
+        self.assertEqual([(p.start_date, p.end_date, p.days) for p in dry_periods],
+                         [('2024-01-06', '2024-01-09', 4), ('2024-01-11', '2024-01-19', 9)])
+
+    def test_counts_repeated_rain_day_once(self):
+        dry_periods, rain_ords = find_dry_periods_in_dates(
+            ['2024-01-05', '2024-01-10', '2024-01-05'], include_to_today=False)
+        self.assertEqual(rain_ords, [date(2024, 1, 5).toordinal(),
+                                     date(2024, 1, 10).toordinal()])
+        self.assertEqual(len(dry_periods), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()